@@ -7,16 +7,177 @@ Author: Kiran Jojare
 Date: 07/08/2024
 """
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from tkinter import *
 from tkinter import filedialog, messagebox, colorchooser
 from PIL import Image, ImageTk
+import pyarrow as pa
+from pyarrow import feather
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 
 logging.basicConfig(level=logging.DEBUG)
 
+BYTE_COLUMNS = [f'Byte_{i}' for i in range(8)]
+LOG_COLUMNS = ['Timestamp_ns', 'ID', 'ID_int', 'DLC'] + BYTE_COLUMNS
+DEFAULT_POINTS_PER_LINE = 2000
+NS_PER_SECOND = 1_000_000_000
+MAX_CAN_ID = 0x1FFFFFFF  # Largest 29-bit extended identifier
+EXTENDED_ID_FLAG = 0x80000000  # Marks extended frames, as in SocketCAN's CAN_EFF_FLAG
+PLOT_POLL_MS = 20
+ZOOM_DEBOUNCE_MS = 100
+CACHE_VERSION = b'2'  # Bump when the meaning of cached columns changes
+
+
+def format_can_id(can_id):
+    """
+    Format an integer CAN ID the way it is shown in the UI.
+
+    Standard IDs are shown as 0x00A; IDs carrying EXTENDED_ID_FLAG are shown as
+    eight hex digits with a trailing 'x', e.g. 18FEF100x, so the two frame
+    formats never share a label.
+    """
+    if can_id & EXTENDED_ID_FLAG:
+        return f'{can_id & MAX_CAN_ID:08X}x'
+    return f'0x{can_id:03X}'
+
+
+def parse_can_id(raw_id):
+    """
+    Parse a CAN ID token from a log file.
+
+    Accepts plain or 0x-prefixed hex, plus the trailing 'x' some loggers use to
+    mark extended IDs (e.g. 18FEF100x). Suffixed IDs get EXTENDED_ID_FLAG set so
+    an extended frame never shares its key with a standard frame of equal value.
+    Labels produced by format_can_id parse back to the same key.
+
+    Args:
+        raw_id (str): The ID token as read from the log.
+
+    Returns:
+        int: The CAN ID, or None if the token is not a valid CAN ID.
+    """
+    token = raw_id.strip()
+    flag = 0
+    if token[-1:] in ('x', 'X') and not token.lower().startswith('0x'):
+        token = token[:-1]
+        flag = EXTENDED_ID_FLAG
+    try:
+        can_id = int(token, 16)
+    except ValueError:
+        return None
+    return can_id | flag if 0 <= can_id <= MAX_CAN_ID else None
+
+
+def encode_can_ids(raw_ids):
+    """
+    Parse a column of CAN ID tokens into integer keys and display labels.
+
+    Each distinct token is parsed once; rows then share integer IDs and
+    categorical labels instead of per-row Python strings.
+
+    Args:
+        raw_ids (Series): ID tokens as read from the log; missing fields are NaN.
+
+    Returns:
+        tuple: (IntegerArray, Categorical, list) holding the UInt32 keys from
+        parse_can_id, the labels from format_can_id (categories sorted by key)
+        and the distinct tokens that could not be parsed. Rows with a missing or
+        unparseable ID are NA in both columns.
+    """
+    codes, uniques = pd.factorize(raw_ids)
+    parsed = [parse_can_id(raw_id) for raw_id in uniques]
+    valid = np.array([can_id is not None for can_id in parsed], dtype=bool)
+    bad_ids = [raw_id for raw_id, ok in zip(uniques, valid) if not ok]
+    can_ids, id_codes = np.unique(
+        np.array([can_id for can_id in parsed if can_id is not None], dtype=np.uint32),
+        return_inverse=True
+    )
+    # Category code per distinct token, -1 for unparseable ones; the extra
+    # trailing -1 is picked by rows whose ID field was missing (code -1)
+    token_codes = np.full(len(uniques) + 1, -1, dtype=np.intp)
+    token_codes[:-1][valid] = id_codes
+    row_codes = token_codes[codes]
+    padded_ids = np.append(can_ids, np.uint32(0))
+    id_int = pd.arrays.IntegerArray(padded_ids[row_codes], row_codes < 0)
+    labels = pd.Categorical.from_codes(row_codes, [format_can_id(v) for v in can_ids])
+    return id_int, labels, bad_ids
+
+
+def minmax_downsample(y, n_out):
+    """
+    Select the samples to draw so each line keeps its visual envelope.
+
+    The series is split into at most n_out // 2 equal buckets and the minimum and
+    maximum of each bucket are kept, along with the first and last sample. A 2-D
+    input is reduced for all of its columns in the same pass.
+
+    Args:
+        y (ndarray): (N,) series or (N, M) block of series to downsample, with
+            time along the first axis. NaN samples are skipped, except that a
+            bucket holding only NaN selects its first sample.
+        n_out (int): Approximate number of points to keep per series.
+
+    Returns:
+        ndarray: Sorted indices into the first axis of y, shaped (K,) for a 1-D
+        input or (M, K) with one row per column. An index may repeat when it is
+        both a bucket extreme and an endpoint.
+    """
+    block = y if y.ndim == 2 else y[:, None]
+    n, m = block.shape
+    if n <= n_out:
+        idx = np.broadcast_to(np.arange(n), (m, n))
+        return idx[0] if y.ndim == 1 else idx
+    bin_size = -(-n // max(n_out // 2, 1))
+    n_bins = n // bin_size
+    filled_min = np.where(np.isnan(block), np.inf, block)
+    filled_max = np.where(np.isnan(block), -np.inf, block)
+    # Whole buckets are reduced in one reshape; the short tail gets its own bucket
+    main = n_bins * bin_size
+    offsets = (np.arange(n_bins) * bin_size)[:, None]
+    parts = [
+        offsets + filled_min[:main].reshape(n_bins, bin_size, m).argmin(axis=1),
+        offsets + filled_max[:main].reshape(n_bins, bin_size, m).argmax(axis=1),
+        np.zeros((1, m), dtype=np.intp),
+        np.full((1, m), n - 1),
+    ]
+    if main < n:
+        parts.append(main + filled_min[main:].argmin(axis=0)[None, :])
+        parts.append(main + filled_max[main:].argmax(axis=0)[None, :])
+    idx = np.sort(np.concatenate(parts), axis=0).T
+    return idx[0] if y.ndim == 1 else idx
+
+
+def build_byte_segments(ts_ns, bytes_num, bytes_missing, rows, n_out):
+    """
+    Build the downsampled line segments for the eight data bytes of one signal.
+
+    Args:
+        ts_ns (ndarray): int64 nanosecond timestamps of all frames in the log.
+        bytes_num (ndarray): (N, 8) uint8 data bytes of all frames in the log.
+        bytes_missing (ndarray): (N, 8) bool mask of the bytes absent from each frame.
+        rows (ndarray): Row indices of the frames belonging to the signal.
+        n_out (int): Approximate number of points to keep per byte.
+
+    Returns:
+        ndarray: (8, K, 2) array of (timestamp, value) points, one line per byte.
+    """
+    # Only the signal's own rows are widened to float, with NaN for missing bytes
+    ydata = bytes_num[rows].astype(np.float32)
+    ydata[bytes_missing[rows]] = np.nan
+    # Only draw the min/max envelope of each byte; the full series has far more
+    # samples than the axis has pixels. All eight bytes are reduced in one call.
+    sel = minmax_downsample(ydata, n_out)
+    # Only the points actually drawn are converted back to seconds
+    ts = ts_ns[rows[sel]] / NS_PER_SECOND
+    return np.stack([ts, np.take_along_axis(ydata.T, sel, axis=1)], axis=-1)
+
+
 class CANLogAnalyzer:
     """
     Class to analyze CAN log files and visualize the data.
@@ -25,6 +186,18 @@ class CANLogAnalyzer:
         root (Tk): The root Tkinter window.
         log_file (str): Path to the CAN log file.
         df (DataFrame): DataFrame to store CAN log data.
+        ts_ns (ndarray): Sorted int64 frame timestamps in nanoseconds, row-aligned with df.
+        bytes_num (ndarray): (N, 8) uint8 array of the data bytes, row-aligned with df.
+        bytes_missing (ndarray): (N, 8) bool mask of missing or invalid bytes in bytes_num.
+        id_groups (dict): Maps each integer CAN ID key (see parse_can_id) to the row
+            indices of its frames.
+        fig (Figure): The plot window, kept so replots can update it in place.
+        signal_axes (dict): Maps each plotted signal to its (Axes, LineCollection).
+        executor (ThreadPoolExecutor): Runs the per-signal plot preparation off the Tk thread.
+        zoom_rows (dict): Maps each plotted signal to its row indices for zoom re-aggregation.
+        zoom_points (int): Points per byte used when re-aggregating after a zoom.
+        zoom_xlim (tuple): Last x limits re-aggregation was requested for.
+        zoom_after_id (str): Pending debounced zoom re-aggregation, if any.
     """
 
     def __init__(self, root):
@@ -41,10 +214,36 @@ class CANLogAnalyzer:
 
         self.log_file = ""
         self.df = pd.DataFrame()
+        self.ts_ns = np.empty(0, dtype=np.int64)
+        self.bytes_num = np.empty((0, 8), dtype=np.uint8)
+        self.bytes_missing = np.empty((0, 8), dtype=bool)
+        self.id_groups = {}
         self.colors = {}  # Store colors for each signal
+        # The asset is stored at its display size, so it is decoded once and reused
+        # every time the welcome window is rebuilt
+        can_image_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'can_image_300x150.png')
+        self.can_photo = ImageTk.PhotoImage(Image.open(can_image_path))
+        self.fig = None
+        self.signal_axes = {}
+        self.executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self.zoom_rows = {}
+        self.zoom_points = DEFAULT_POINTS_PER_LINE
+        self.zoom_xlim = None
+        self.zoom_after_id = None
+        self.root.bind('<Destroy>', self.on_destroy, add='+')
 
         self.create_welcome_window()
 
+    def on_destroy(self, event):
+        """
+        Stop the worker threads when the root window is destroyed.
+
+        Args:
+            event (Event): The Destroy event; it also fires for every child widget.
+        """
+        if event.widget is self.root:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
     def create_welcome_window(self):
         """Create the welcome window with author information."""
         self.clear_window()
@@ -55,10 +254,6 @@ class CANLogAnalyzer:
         author_label = Label(self.root, text="Author: Kiran Jojare", font=("Helvetica", 12), bg='#2C3E50', fg='#ECF0F1')
         author_label.pack(pady=10)
 
-        can_image_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'can_image.png')  # Corrected path
-        can_image = Image.open(can_image_path)
-        can_image = can_image.resize((300, 150), Image.LANCZOS)
-        self.can_photo = ImageTk.PhotoImage(can_image)
         image_label = Label(self.root, image=self.can_photo, bg='#2C3E50')
         image_label.pack(pady=10)
 
@@ -83,16 +278,18 @@ class CANLogAnalyzer:
         )
         if self.log_file:
             try:
-                self.df = pd.read_csv(
-                    self.log_file,
-                    sep=r'\s+',
-                    names=['Timestamp', 'ID', 'DLC', 'Data'],
-                    dtype={'ID': str, 'Data': str},  # Ensure ID and Data are read as strings
-                    engine='python'
-                )
+                self.df = self.read_log_file()
                 logging.debug("Loaded DataFrame: \n%s", self.df.head())
-                self.df['Timestamp'] = self.df['Timestamp'].astype(float)
-                self.split_data_column()
+                self.ts_ns = self.df['Timestamp_ns'].to_numpy()
+                # Keep the bytes as one uint8 block plus a mask; the byte columns were
+                # only needed for the cache, so drop them instead of holding two copies
+                byte_block = self.df[BYTE_COLUMNS]
+                self.bytes_missing = byte_block.isna().to_numpy()
+                self.bytes_num = byte_block.to_numpy(dtype=np.uint8, na_value=0)
+                self.df = self.df.drop(columns=BYTE_COLUMNS)
+                logging.debug("Data bytes: \n%s", self.bytes_num[:5])
+                # Index the rows of each ID once so plotting is a dict lookup
+                self.id_groups = self.df.groupby('ID_int', sort=False).indices
                 self.file_label.config(text=f"Loaded file: {self.log_file}")
                 self.create_signal_selection_window()
             except Exception as e:
@@ -101,18 +298,128 @@ class CANLogAnalyzer:
         else:
             self.file_label.config(text="No file selected")
 
-    def split_data_column(self):
-        """Split the 'Data' column into individual byte columns."""
+    def read_log_file(self):
+        """
+        Parse the CAN log file into a DataFrame, reusing a cached copy when possible.
+
+        The parsed frame is written to a sibling '.feather' file together with the
+        size and mtime of the log it came from; later loads read it directly as
+        long as both still match the log file.
+
+        Returns:
+            DataFrame: Parsed log with LOG_COLUMNS; 'ID' is a categorical display
+            label, 'ID_int' the CAN ID key from parse_can_id as UInt32 (NA when
+            the ID could not be parsed), 'Timestamp_ns' the int64 frame time in
+            nanoseconds and the byte columns UInt8, sorted by timestamp.
+        """
+        cache_path = self.log_file + '.feather'
+        # Key the cache on the exact source size and mtime rather than "newer than":
+        # copies that preserve timestamps can replace a log with an older file
+        log_stat = os.stat(self.log_file)
+        source_key = {b'source_size': str(log_stat.st_size).encode(),
+                      b'source_mtime_ns': str(log_stat.st_mtime_ns).encode(),
+                      b'cache_version': CACHE_VERSION}
+        df = self._read_cached_log(cache_path, source_key)
+        if df is None:
+            df = self._parse_log()
+            self._write_cache(df, cache_path, source_key)
+        return df
+
+    @staticmethod
+    def _read_cached_log(cache_path, source_key):
+        """
+        Load the cached DataFrame if it matches the current layout and source file.
+
+        Args:
+            cache_path (str): Path of the '.feather' cache.
+            source_key (dict): Schema metadata the cache must carry to be used.
+
+        Returns:
+            DataFrame: The cached log, or None when it is missing, stale or unreadable.
+        """
+        if not os.path.exists(cache_path):
+            return None
         try:
-            data_split = self.df['Data'].str.split(' ', expand=True)
-            # Ensure there are 8 bytes by padding with NaN if there are fewer than 8 columns
-            data_split = data_split.reindex(columns=range(8), fill_value=float('nan'))
-            for i in range(8):
-                self.df[f'Byte_{i}'] = pd.to_numeric(data_split[i], errors='coerce')
-            logging.debug("Data after splitting: \n%s", self.df.head())
+            table = feather.read_table(cache_path)
         except Exception as e:
-            logging.error(f"Failed to split 'Data' column: {e}")
-            messagebox.showerror("Error", f"Failed to split 'Data' column: {e}")
+            logging.warning("Ignoring unreadable cache %s: %s", cache_path, e)
+            return None
+        metadata = table.schema.metadata or {}
+        if table.column_names != LOG_COLUMNS:
+            logging.debug("Cache %s has an outdated layout, re-parsing", cache_path)
+            return None
+        if any(metadata.get(key) != value for key, value in source_key.items()):
+            logging.debug("Cache %s was built from a different file, re-parsing", cache_path)
+            return None
+        logging.debug("Loaded cached DataFrame from %s", cache_path)
+        return table.to_pandas()
+
+    def _parse_log(self):
+        """
+        Parse the log file itself into the layout described in read_log_file.
+
+        Returns:
+            DataFrame: Parsed log, sorted by timestamp.
+        """
+        # The whitespace split already separates the data bytes, so name them
+        # directly; rows with a DLC below 8 are padded with NaN.
+        # sep=r'\s+' with the C engine uses its native whitespace tokenizer, and
+        # memory_map lets it read large captures straight from the page cache.
+        read_kwargs = {
+            'sep': r'\s+',
+            'names': ['Timestamp', 'ID', 'DLC'] + BYTE_COLUMNS,
+            'engine': 'c',
+            'memory_map': True,
+        }
+        dtypes = {'Timestamp': 'float64', 'ID': str, 'DLC': 'int8'}
+        try:
+            # Let the tokenizer convert the bytes straight into float32 columns
+            df = pd.read_csv(self.log_file, dtype={**dtypes, **dict.fromkeys(BYTE_COLUMNS, 'float32')}, **read_kwargs)
+        except ValueError:
+            # A malformed byte token; re-read and coerce only the affected columns
+            logging.debug("Malformed data bytes in %s, coercing to NaN", self.log_file)
+            df = pd.read_csv(self.log_file, dtype=dtypes, **read_kwargs)
+            for col in BYTE_COLUMNS:
+                if not pd.api.types.is_numeric_dtype(df[col]):
+                    df[col] = pd.to_numeric(df[col], errors='coerce')
+            df[BYTE_COLUMNS] = df[BYTE_COLUMNS].astype('float32')
+        id_int, id_labels, bad_ids = encode_can_ids(df['ID'])
+        if bad_ids:
+            logging.warning("Unparseable CAN IDs in %s are left as NA: %s", self.log_file, bad_ids[:10])
+        df.insert(2, 'ID_int', id_int)
+        df['ID'] = id_labels
+        # Replace the float seconds with integer ticks: they give exact ordering and
+        # range comparisons, and keeping both would hold every timestamp twice
+        timestamp_ns = np.rint(df['Timestamp'].to_numpy() * NS_PER_SECOND).astype(np.int64)
+        df = df.drop(columns='Timestamp')
+        df.insert(0, 'Timestamp_ns', timestamp_ns)
+        # Store bytes as nullable UInt8 (one byte plus a mask bit per cell); values
+        # that are not a valid byte become NA instead of wrapping around
+        byte_block = df[BYTE_COLUMNS]
+        is_byte = (byte_block >= 0) & (byte_block <= 255) & (byte_block % 1 == 0)
+        df[BYTE_COLUMNS] = byte_block.where(is_byte).astype('UInt8')
+        # Time-ordered rows let time ranges be found by binary search; sorting before
+        # the cache is written means cached reloads never sort again
+        if not df['Timestamp_ns'].is_monotonic_increasing:
+            df = df.sort_values('Timestamp_ns', kind='stable', ignore_index=True)
+        return df
+
+    @staticmethod
+    def _write_cache(df, cache_path, source_key):
+        """
+        Write the parsed log to its '.feather' cache, tagged with source_key.
+
+        Args:
+            df (DataFrame): Parsed log from _parse_log.
+            cache_path (str): Path of the '.feather' cache.
+            source_key (dict): Schema metadata identifying the source file.
+        """
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), **source_key})
+            feather.write_feather(table, cache_path)
+        except Exception as e:
+            logging.warning("Could not write cache %s: %s", cache_path, e)
 
     def create_signal_selection_window(self):
         """Create the signal selection and plot customization window."""
@@ -124,13 +431,21 @@ class CANLogAnalyzer:
         self.signal_listbox = Listbox(self.root, selectmode=MULTIPLE, bg='#34495E', fg='#ECF0F1', font=("Helvetica", 10))
         self.signal_listbox.pack(pady=5)
 
-        # Populate the listbox with unique CAN IDs from the log file
-        for can_id in sorted(self.df['ID'].unique()):
-            self.signal_listbox.insert(END, can_id)
+        # Populate the listbox with unique CAN IDs from the log file; the ID
+        # categories are already the sorted, formatted labels from np.unique.
+        # A single insert call makes one Tcl round-trip for all of them.
+        self.signal_listbox.insert(END, *self.df['ID'].cat.categories)
 
         self.color_btn = Button(self.root, text="Choose Color", command=self.choose_color, bg='#3498DB', fg='#ECF0F1', font=("Helvetica", 10, "bold"))
         self.color_btn.pack(pady=5)
 
+        self.points_label = Label(self.root, text="Points per line:", bg='#2C3E50', fg='#ECF0F1')
+        self.points_label.pack()
+
+        self.points_entry = Entry(self.root, width=10, bg='#34495E', fg='#ECF0F1')
+        self.points_entry.insert(0, str(DEFAULT_POINTS_PER_LINE))
+        self.points_entry.pack(pady=5)
+
         self.plot_btn = Button(self.root, text="Plot Data", command=self.plot_data, bg='#2ECC71', fg='#ECF0F1', font=("Helvetica", 10, "bold"))
         self.plot_btn.pack(pady=10)
 
@@ -156,32 +471,267 @@ class CANLogAnalyzer:
             messagebox.showwarning("File Error", "No file loaded")
             return
 
-        last_timestamp = self.df['Timestamp'].max()
+        try:
+            n_out = int(self.points_entry.get())
+        except ValueError:
+            n_out = 0
+        if n_out < 2:
+            messagebox.showwarning("Input Error", "Points per line must be an integer of at least 2")
+            return
 
-        fig, axs = plt.subplots(len(selected_signals), 1, figsize=(15, 8 * len(selected_signals)), sharex=True)
-        if len(selected_signals) == 1:
-            axs = [axs]
+        # Filtering and downsampling run on worker threads (NumPy releases the GIL)
+        # so the Tk event loop stays responsive; drawing happens back on this thread
+        # Each selected ID is resolved to its row indices with one dict lookup, so
+        # no pass over the full frame is needed however many IDs are selected
+        futures = {}
+        for signal in selected_signals:
+            rows = self.id_groups.get(parse_can_id(signal))
+            if rows is not None:
+                futures[signal] = (rows, self.executor.submit(build_byte_segments, self.ts_ns, self.bytes_num, self.bytes_missing, rows, n_out))
 
-        for ax, signal in zip(axs, selected_signals):
-            df_filtered = self.df[self.df['ID'].str.strip().str.upper() == signal.upper()]
-            if df_filtered.empty:
+        # Block re-entrant clicks until this plot has been drawn
+        self.plot_btn.config(state=DISABLED)
+        self.poll_futures(futures, self.finish_plot, selected_signals, self.ts_ns[-1] / NS_PER_SECOND, n_out)
+
+    def poll_futures(self, futures, on_done, *args):
+        """
+        Hand the worker results to on_done once all are finished, otherwise check again later.
+
+        Tk widgets may only be touched from the main thread, so completion is
+        polled with root.after rather than signalled from the workers.
+
+        Args:
+            futures (dict): Maps each signal to its (rows, pending segments).
+            on_done (callable): Called as on_done(segments, *args), where segments
+                maps each signal to its (rows, byte segments), or is None if a
+                worker failed.
+            *args: Extra arguments passed through to on_done.
+        """
+        if not all(future.done() for _, future in futures.values()):
+            self.root.after(PLOT_POLL_MS, self.poll_futures, futures, on_done, *args)
+            return
+
+        try:
+            segments = {signal: (rows, future.result()) for signal, (rows, future) in futures.items()}
+        except Exception as e:
+            logging.error(f"Failed to prepare plot data: {e}")
+            messagebox.showerror("Error", f"Failed to prepare plot data: {e}")
+            segments = None
+        on_done(segments, *args)
+
+    def finish_plot(self, segments, selected_signals, last_timestamp, n_out):
+        """
+        Re-enable plotting and draw the prepared segments of a Plot Data click.
+
+        Args:
+            segments (dict): Maps each signal found in the log to its (rows, byte
+                segments), or None if preparing them failed.
+            selected_signals (list): CAN IDs selected in the listbox.
+            last_timestamp (float): Largest timestamp in the log, used as the x limit.
+            n_out (int): Approximate number of points drawn per byte.
+        """
+        self.plot_btn.config(state=NORMAL)
+        if segments is not None:
+            self.draw_plot(selected_signals, segments, last_timestamp, n_out)
+
+    def draw_plot(self, selected_signals, segments, last_timestamp, n_out):
+        """
+        Draw the prepared byte segments of the selected signals.
+
+        Args:
+            selected_signals (list): CAN IDs selected in the listbox.
+            segments (dict): Maps each signal found in the log to its (rows, byte segments).
+            last_timestamp (float): Largest timestamp in the log, used as the x limit.
+            n_out (int): Approximate number of points drawn per byte.
+        """
+        default_colors = [f'C{i}' for i in range(8)]
+
+        # Reuse the open figure when it already shows these signals so a replot
+        # only swaps the data of the existing artists
+        is_new_figure = not self.figure_shows(selected_signals)
+        if is_new_figure:
+            self.create_plot_figure(selected_signals)
+        # Keep the zoom handler idle while the full-range segments are installed
+        self.zoom_rows = {}
+
+        # A single figure legend replaces eight entries on every axis: one entry per
+        # default byte color (only when some signal uses them) plus one per signal
+        # drawn in a custom color
+        handles = []
+        labels = []
+        uses_default_colors = False
+
+        for signal in selected_signals:
+            ax, collection = self.signal_axes[signal]
+            if signal not in segments:
+                collection.set_segments([])
                 continue
+            _, segs = segments[signal]
             logging.debug("Plotting data for signal: %s", signal)
             color = self.colors.get(signal, None)
-            for i in range(8):
-                ax.plot(df_filtered['Timestamp'], df_filtered[f'Byte_{i}'], label=f'{signal} Byte {i}', color=color)
+            # One collection per axis is stroked in a single pass instead of eight Line2D artists
+            collection.set_segments(segs)
+            collection.set_color([color] * 8 if color else default_colors)
+            # relim() does not account for collections, so rebuild the data limits here
+            ax.ignore_existing_data_limits = True
+            ax.update_datalim(np.concatenate(segs))
+            ax.autoscale_view()
+            ax.set_xlim(0, last_timestamp)
+            if color:
+                handles.append(Line2D([], [], color=color, linewidth=1))
+                labels.append(f'{signal} (all bytes)')
+            else:
+                uses_default_colors = True
+
+        if uses_default_colors:
+            handles[:0] = [Line2D([], [], color=c, linewidth=1) for c in default_colors]
+            labels[:0] = [f'Byte {i}' for i in range(8)]
+        if self.fig.legends:
+            self.fig.legends[0].remove()
+        if handles:
+            self.fig.legend(handles, labels, loc='outside right upper')
+
+        self.zoom_rows = {signal: rows for signal, (rows, _) in segments.items()}
+        self.zoom_points = n_out
+        self.zoom_xlim = (0, last_timestamp)
+
+        if is_new_figure:
+            plt.show(block=False)
+        else:
+            self.fig.canvas.draw_idle()
+
+    def figure_shows(self, selected_signals):
+        """
+        Check whether the plot window is still open and shows exactly these signals.
+
+        Args:
+            selected_signals (list): CAN IDs selected in the listbox.
+
+        Returns:
+            bool: True if the cached figure can be updated in place.
+        """
+        return (self.fig is not None and plt.fignum_exists(self.fig.number)
+                and list(self.signal_axes) == selected_signals)
+
+    def create_plot_figure(self, selected_signals):
+        """
+        Create the plot window with one empty axis per selected signal.
+
+        Args:
+            selected_signals (list): CAN IDs selected in the listbox.
+        """
+        if self.fig is not None:
+            plt.close(self.fig)
+
+        # Cap the height so the Agg buffer stays bounded however many signals are selected
+        self.fig, axs = plt.subplots(
+            len(selected_signals), 1,
+            figsize=(15, min(2.5 * len(selected_signals), 16)),
+            sharex=True,
+            layout='constrained'
+        )
+        if len(selected_signals) == 1:
+            axs = [axs]
+
+        self.signal_axes = {}
+        for ax, signal in zip(axs, selected_signals):
+            collection = LineCollection([], linewidths=1)
+            ax.add_collection(collection, autolim=False)
             ax.set_ylabel('Data')
             ax.set_title(f'CAN Data Plot for {signal}')
-            ax.set_xlim(0, last_timestamp)
-            ax.legend(loc='upper right')
             ax.grid(True)
+            self.signal_axes[signal] = (ax, collection)
+
+        # The axes share x, so one handler sees every zoom or pan; connecting it on
+        # each axis would re-aggregate all signals once per axis
+        axs[0].callbacks.connect('xlim_changed', self.on_xlim_changed)
+        axs[-1].set_xlabel('Timestamp')
+
+    def on_xlim_changed(self, ax):
+        """
+        Schedule a re-aggregation of the plotted signals after a zoom or pan.
+
+        A pan drag changes the limits on every mouse motion, so the work is
+        debounced: only the limits still current after ZOOM_DEBOUNCE_MS are handled.
+
+        Args:
+            ax (Axes): The axis whose x limits changed; all signal axes share them.
+        """
+        if not self.zoom_rows:
+            return
+        if self.zoom_after_id is not None:
+            self.root.after_cancel(self.zoom_after_id)
+        self.zoom_after_id = self.root.after(ZOOM_DEBOUNCE_MS, self.reaggregate_visible, ax)
+
+    def reaggregate_visible(self, ax):
+        """
+        Re-aggregate the plotted signals for the visible time range.
 
-        plt.xlabel('Timestamp')
-        plt.show()
+        Only the frames inside the current x limits are downsampled, so zooming in
+        reveals full detail while the number of drawn points stays constant. The
+        downsampling runs on the worker threads like a full plot does.
+
+        Args:
+            ax (Axes): Any of the signal axes; they share their x limits.
+        """
+        self.zoom_after_id = None
+        xlim = tuple(ax.get_xlim())
+        if xlim == self.zoom_xlim:
+            return
+        self.zoom_xlim = xlim
+        window = self.slice_time(*xlim)
+        futures = {}
+        for signal, rows in self.zoom_rows.items():
+            # rows is ascending, so the window maps onto it by binary search too; keep
+            # one frame beyond each edge so the lines run to the axis border
+            start, stop = np.searchsorted(rows, [window.start, window.stop])
+            visible = rows[max(start - 1, 0):stop + 1]
+            futures[signal] = (visible, self.executor.submit(
+                build_byte_segments, self.ts_ns, self.bytes_num, self.bytes_missing, visible, self.zoom_points))
+        self.poll_futures(futures, self.apply_zoom_segments, xlim, self.zoom_rows)
+
+    def apply_zoom_segments(self, segments, xlim, zoom_rows):
+        """
+        Install re-aggregated segments unless the view has moved on since they were requested.
+
+        Args:
+            segments (dict): Maps each signal to its (rows, byte segments), or None
+                if preparing them failed.
+            xlim (tuple): The x limits the segments were built for.
+            zoom_rows (dict): The signal rows in effect when they were requested.
+        """
+        # A later zoom or a new plot makes these results stale
+        if segments is None or xlim != self.zoom_xlim or zoom_rows is not self.zoom_rows:
+            return
+        for signal, (_, segs) in segments.items():
+            _, collection = self.signal_axes[signal]
+            collection.set_segments(segs)
+        self.fig.canvas.draw_idle()
+
+    def slice_time(self, lo, hi):
+        """
+        Find the rows whose timestamps fall inside a time range.
+
+        Args:
+            lo (float): Start of the range, inclusive.
+            hi (float): End of the range, inclusive.
+
+        Returns:
+            slice: Row positions of the frames in [lo, hi], found in O(log N).
+        """
+        # Round the bounds inward to whole ticks so the search stays in int64
+        start = np.searchsorted(self.ts_ns, np.int64(np.ceil(lo * NS_PER_SECOND)), side='left')
+        stop = np.searchsorted(self.ts_ns, np.int64(np.floor(hi * NS_PER_SECOND)), side='right')
+        return slice(int(start), int(stop))
 
     def clear_data(self):
         """Clear the loaded data and reset the UI."""
         self.df = pd.DataFrame()
+        self.ts_ns = np.empty(0, dtype=np.int64)
+        self.bytes_num = np.empty((0, 8), dtype=np.uint8)
+        self.bytes_missing = np.empty((0, 8), dtype=bool)
+        self.id_groups = {}
+        self.zoom_rows = {}
         self.file_label.config(text="No file selected")
         self.signal_listbox.delete(0, END)
         self.colors.clear()
@@ -0,0 +1,62 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from canalyzer_mimic import CANLogAnalyzer  # noqa: E402
+
+
+class LogCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.analyzer = CANLogAnalyzer.__new__(CANLogAnalyzer)
+        self.analyzer.log_file = os.path.join(self.tmp.name, 'log.txt')
+
+    def write_log(self, text, mtime_ns=None):
+        with open(self.analyzer.log_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if mtime_ns is not None:
+            os.utime(self.analyzer.log_file, ns=(mtime_ns, mtime_ns))
+
+    def read(self):
+        with mock.patch.object(CANLogAnalyzer, '_parse_log', autospec=True,
+                               side_effect=CANLogAnalyzer._parse_log) as parse:
+            df = self.analyzer.read_log_file()
+        return df, parse.called
+
+    def test_unchanged_log_is_read_from_cache(self):
+        self.write_log('0.1 001 2 1 2\n0.2 002 1 3\n')
+        _, parsed = self.read()
+        self.assertTrue(parsed)
+        self.assertTrue(os.path.exists(self.analyzer.log_file + '.feather'))
+        df, parsed = self.read()
+        self.assertFalse(parsed)
+        self.assertEqual(len(df), 2)
+
+    def test_same_mtime_different_size_is_reparsed(self):
+        mtime_ns = os.stat(self.tmp.name).st_mtime_ns
+        self.write_log('0.1 001 2 1 2\n0.2 002 1 3\n', mtime_ns)
+        self.read()
+        self.write_log('0.1 001 2 1 2\n0.2 002 1 3\n0.3 003 1 4\n', mtime_ns)
+        self.assertEqual(os.stat(self.analyzer.log_file).st_mtime_ns, mtime_ns)
+        df, parsed = self.read()
+        self.assertTrue(parsed)
+        self.assertEqual(list(df['ID']), ['0x001', '0x002', '0x003'])
+
+    def test_older_replacement_is_reparsed(self):
+        mtime_ns = os.stat(self.tmp.name).st_mtime_ns
+        self.write_log('0.1 001 2 1 2\n', mtime_ns)
+        self.read()
+        self.write_log('0.1 00A 2 1 2\n', mtime_ns - 10 ** 9)
+        df, parsed = self.read()
+        self.assertTrue(parsed)
+        self.assertEqual(list(df['ID']), ['0x00A'])
+
+
+if __name__ == '__main__':
+    unittest.main()
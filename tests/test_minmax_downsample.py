@@ -0,0 +1,53 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from canalyzer_mimic import minmax_downsample  # noqa: E402
+
+
+class MinMaxDownsampleTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.y = rng.normal(size=(10_007, 3))
+        self.y[::7, 1] = np.nan
+        self.y[2000:2600, 2] = np.nan
+        self.n_out = 200
+
+    def test_short_series_is_returned_whole(self):
+        np.testing.assert_array_equal(minmax_downsample(np.arange(5.0), 10), np.arange(5))
+
+    def test_keeps_endpoints_sorted_and_bounded(self):
+        idx = minmax_downsample(self.y, self.n_out)
+        self.assertEqual(idx.shape[0], self.y.shape[1])
+        self.assertLessEqual(idx.shape[1], self.n_out + 4)
+        for row in idx:
+            self.assertEqual(row[0], 0)
+            self.assertEqual(row[-1], len(self.y) - 1)
+            self.assertTrue(np.all(np.diff(row) >= 0))
+
+    def test_keeps_column_extremes_with_nan(self):
+        idx = minmax_downsample(self.y, self.n_out)
+        for col, row in enumerate(idx):
+            kept = self.y[row, col]
+            self.assertEqual(np.nanmin(kept), np.nanmin(self.y[:, col]))
+            self.assertEqual(np.nanmax(kept), np.nanmax(self.y[:, col]))
+
+    def test_all_nan_bucket_selects_its_first_sample(self):
+        y = np.arange(40.0)
+        y[10:20] = np.nan
+        idx = minmax_downsample(y, 8)
+        self.assertIn(10, idx)
+        self.assertFalse(np.isin(np.arange(11, 20), idx).any())
+
+    def test_one_dimensional_matches_column(self):
+        idx = minmax_downsample(self.y, self.n_out)
+        np.testing.assert_array_equal(minmax_downsample(self.y[:, 1], self.n_out), idx[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from canalyzer_mimic import (  # noqa: E402
+    EXTENDED_ID_FLAG, MAX_CAN_ID, CANLogAnalyzer, format_can_id, parse_can_id
+)
+
+
+class ParseCanIdTest(unittest.TestCase):
+
+    def test_accepted_forms(self):
+        self.assertEqual(parse_can_id('7FF'), 0x7FF)
+        self.assertEqual(parse_can_id('0x00A'), 0x00A)
+        self.assertEqual(parse_can_id('0X7ff'), 0x7FF)
+        self.assertEqual(parse_can_id(' 100 '), 0x100)
+        self.assertEqual(parse_can_id('18FEF100x'), 0x18FEF100 | EXTENDED_ID_FLAG)
+        self.assertEqual(parse_can_id('18fef100X'), 0x18FEF100 | EXTENDED_ID_FLAG)
+
+    def test_invalid_tokens_return_none(self):
+        for token in ('-1', '', 'x', '0x', 'zz', '0x1x', f'{MAX_CAN_ID + 1:X}', f'{MAX_CAN_ID + 1:X}x'):
+            with self.subTest(token=token):
+                self.assertIsNone(parse_can_id(token))
+
+    def test_largest_extended_id_is_accepted(self):
+        self.assertEqual(parse_can_id(f'{MAX_CAN_ID:X}x'), MAX_CAN_ID | EXTENDED_ID_FLAG)
+
+    def test_standard_and_extended_stay_distinct(self):
+        standard, extended = parse_can_id('100'), parse_can_id('100x')
+        self.assertNotEqual(standard, extended)
+        self.assertNotEqual(format_can_id(standard), format_can_id(extended))
+
+    def test_labels_parse_back_to_their_key(self):
+        for token in ('00A', '7FF', '100x', '18FEF100x'):
+            with self.subTest(token=token):
+                can_id = parse_can_id(token)
+                self.assertEqual(parse_can_id(format_can_id(can_id)), can_id)
+
+
+class LogIdColumnsTest(unittest.TestCase):
+
+    def test_unparseable_ids_are_na_and_formats_stay_apart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = os.path.join(tmp, 'log.txt')
+            with open(log_file, 'w', encoding='utf-8') as f:
+                f.write('0.1 100 1 1\n0.2 100x 1 2\n0.3 zz 1 3\n0.4 100 1 4\n')
+            analyzer = CANLogAnalyzer.__new__(CANLogAnalyzer)
+            analyzer.log_file = log_file
+            with self.assertLogs(level='WARNING'):
+                df = analyzer.read_log_file()
+
+        self.assertEqual(len(df), 4)
+        self.assertEqual(df['ID_int'].isna().tolist(), [False, False, True, False])
+        self.assertEqual(df['ID'].isna().tolist(), [False, False, True, False])
+        groups = df.groupby('ID_int', sort=False).indices
+        self.assertEqual(groups[0x100].tolist(), [0, 3])
+        self.assertEqual(groups[0x100 | EXTENDED_ID_FLAG].tolist(), [1])
+        self.assertEqual(list(df['ID'].cat.categories), ['0x100', '00000100x'])
+
+
+if __name__ == '__main__':
+    unittest.main()